@@ -5,86 +5,60 @@ UPDATED to use NameValidatorTab component with API functionality
 """
 
 import streamlit as st
-import pandas as pd
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Tuple
+
+# Page config must be the first Streamlit call in the script. Setting it at
+# module top means reruns never re-enter the configuration path inside run()
+st.set_page_config(
+    page_title="Enterprise Name & Address Validator",
+    page_icon="🔍",
+    layout="wide",
+    initial_sidebar_state="collapsed"
+)
 
 # Setup paths
+_PATH_SETUP_DONE = False
+
 def setup_python_path():
-    current_file = Path(__file__).resolve()
-    src_dir = current_file.parent.parent
+    global _PATH_SETUP_DONE
+    if _PATH_SETUP_DONE:
+        return
+    
+    src_dir = Path(__file__).resolve().parent.parent
     if str(src_dir) not in sys.path:
         sys.path.insert(0, str(src_dir))
+    _PATH_SETUP_DONE = True
 
 setup_python_path()
 
-# Import services and components
+# Import core services. The tab components are imported lazily inside
+# _get_tab so cold start does not pay for tab modules the user never opens
 try:
     from name_address_validator.services.validation_service import ValidationService
     from name_address_validator.utils.config import load_usps_credentials
     from name_address_validator.utils.logger import AppLogger
     
-    # Import the tab components
-    from name_address_validator.components.name_validator_tab import NameValidatorTab
-    from name_address_validator.components.address_validator_tab import AddressValidatorTab
-    from name_address_validator.components.monitoring_tab import MonitoringTab
-    
-    COMPONENTS_AVAILABLE = True
+    SERVICES_AVAILABLE = True
     
 except ImportError as e:
     st.error(f"❌ Import Error: {e}")
     st.error("Please ensure all components are properly installed")
-    COMPONENTS_AVAILABLE = False
+    SERVICES_AVAILABLE = False
 
 
-class EnterpriseValidatorApp:
-    """Main application class for enterprise validator"""
-    
-    def __init__(self):
-        self.logger = AppLogger()
-        self.validation_service = None
-        
-        # Initialize tab components
-        self.name_validator_tab = None
-        self.address_validator_tab = None
-        self.monitoring_tab = None
-        
-        self._initialize_services()
-        self._initialize_components()
-    
-    def _initialize_services(self):
-        """Initialize core services"""
-        try:
-            self.validation_service = ValidationService(debug_callback=self.logger.log)
-            self.logger.log("✅ Validation services initialized", "SYSTEM")
-        except Exception as e:
-            self.logger.log(f"❌ Failed to initialize services: {e}", "SYSTEM", level="ERROR")
-            st.error(f"Service initialization failed: {e}")
-    
-    def _initialize_components(self):
-        """Initialize tab components"""
-        if not COMPONENTS_AVAILABLE or not self.validation_service:
-            self.logger.log("❌ Cannot initialize components - missing dependencies", "SYSTEM", level="ERROR")
-            return
-        
-        try:
-            # Initialize tab components
-            self.name_validator_tab = NameValidatorTab(self.validation_service, self.logger)
-            self.address_validator_tab = AddressValidatorTab(self.validation_service, self.logger)
-            self.monitoring_tab = MonitoringTab(self.logger)
-            
-            self.logger.log("✅ Tab components initialized", "SYSTEM")
-        except Exception as e:
-            self.logger.log(f"❌ Failed to initialize components: {e}", "SYSTEM", level="ERROR")
-            st.error(f"Component initialization failed: {e}")
-    
-    def apply_enterprise_styling(self):
-        """Apply clean enterprise styling"""
-        st.markdown("""
+# Styling is re-sent on every rerun (Streamlit drops elements that are not
+# re-rendered), but the string itself is built once at import time. The font
+# loads via a stylesheet link instead of a CSS @import: @import serializes
+# behind the style block on every rerun, while a repeated link is deduped by
+# the browser cache
+_FONT_LINK = '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap">'
+
+_ENTERPRISE_CSS = _FONT_LINK + """
         <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
         
         .main {
             font-family: 'Inter', sans-serif;
@@ -202,42 +176,162 @@ class EnterpriseValidatorApp:
         footer {visibility: hidden;}
         header {visibility: hidden;}
         </style>
-        """, unsafe_allow_html=True)
+        """
+
+
+@st.cache_resource
+def _get_logger():
+    """Build the logger once per process so log history survives reruns.
+
+    Buffered because run() flushes at the end of every rerun; the API
+    server and other hosts keep the default immediate console writes.
+    """
+    return AppLogger(buffered=True)
+
+
+@st.cache_resource
+def _get_validation_service():
+    """Build the heavyweight ValidationService once per process.
+
+    Construction loads name dictionaries and USPS credentials; without the
+    cache that happened again on every widget interaction because Streamlit
+    reruns the whole script.
+    """
+    logger = _get_logger()
+    service = ValidationService(debug_callback=logger.log)
+    logger.log("✅ Validation services initialized", "SYSTEM")
+    return service
+
+
+_STATUS_OK_NAME = '<span class="status-indicator status-success">✓ Name Validation Ready</span>'
+_STATUS_WARN_NAME = '<span class="status-indicator status-warning">⚠ Name Service Unavailable</span>'
+_STATUS_OK_ADDR = '<span class="status-indicator status-success">✓ Address Validation Ready</span>'
+_STATUS_WARN_ADDR = '<span class="status-indicator status-warning">⚠ USPS API Not Configured</span>'
+
+# All four header states, assembled once at import - render_header just
+# looks up the (name_ok, addr_ok) pair
+_STATUS_HTML = {
+    (name_ok, addr_ok): (
+        '<div style="text-align: center;">'
+        + (_STATUS_OK_NAME if name_ok else _STATUS_WARN_NAME)
+        + (_STATUS_OK_ADDR if addr_ok else _STATUS_WARN_ADDR)
+        + '</div>'
+    )
+    for name_ok in (True, False)
+    for addr_ok in (True, False)
+}
+
+
+# Static header banner - built once at import instead of re-assembling the
+# markdown string on every rerun
+_HEADER_HTML = """
+<div class="enterprise-header">
+    <div class="main-title">Enterprise Validator</div>
+    <div class="subtitle">Professional Name & Address Validation Platform with API Testing</div>
+</div>
+"""
+
+
+# Two workers, one per availability check. The pool only sees work on a
+# cache miss in _service_status, i.e. at most once per TTL window
+_STATUS_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _service_status(svc_id: int):
+    """Poll service availability at most once a minute.
+
+    render_header re-checked both services on every rerun; the checks can
+    touch credentials/config, so they are cached on the singleton service's
+    id and re-polled when the TTL lapses. The two checks are independent,
+    so on a cache miss they run concurrently and the refresh costs only
+    the slower of the two.
+    """
+    service = _get_validation_service()
+    name_future = _STATUS_POOL.submit(service.is_name_validation_available)
+    addr_future = _STATUS_POOL.submit(service.is_address_validation_available)
+    return (name_future.result(), addr_future.result())
+
+
+class EnterpriseValidatorApp:
+    """Main application class for enterprise validator"""
+    
+    def __init__(self):
+        self.logger = _get_logger()
+        self.validation_service = None
+        
+        self._initialize_services()
+    
+    def _initialize_services(self):
+        """Initialize core services"""
+        if not SERVICES_AVAILABLE:
+            self.logger.log("❌ Cannot initialize services - missing dependencies", "SYSTEM", level="ERROR")
+            return
+        
+        try:
+            self.validation_service = _get_validation_service()
+        except Exception as e:
+            self.logger.log(f"❌ Failed to initialize services: {e}", "SYSTEM", level="ERROR")
+            st.error(f"Service initialization failed: {e}")
+    
+    def _get_tab(self, key: str):
+        """Import and build a tab component on first use in this session.
+
+        Lazy imports mean a tab module (and whatever it drags in) is only
+        loaded once the user actually opens that view. Built instances are
+        cached per session - cache_resource would share one instance across
+        sessions and skip the per-session st.session_state defaults the tab
+        constructors set up.
+        """
+        if not self.validation_service:
+            return None
+        
+        cache = st.session_state.setdefault('_tab_components', {})
+        if key not in cache:
+            component = None
+            try:
+                if key == 'name':
+                    from name_address_validator.components.name_validator_tab import NameValidatorTab
+                    component = NameValidatorTab(self.validation_service, self.logger)
+                elif key == 'address':
+                    from name_address_validator.components.address_validator_tab import AddressValidatorTab
+                    component = AddressValidatorTab(self.validation_service, self.logger)
+                elif key == 'monitoring':
+                    from name_address_validator.components.monitoring_tab import MonitoringTab
+                    component = MonitoringTab(self.logger)
+                
+                self.logger.log(f"✅ {key} tab component initialized", "SYSTEM")
+            except Exception as e:
+                self.logger.log(f"❌ Failed to load {key} tab: {e}", "SYSTEM", level="ERROR")
+                st.error(f"Component initialization failed: {e}")
+            cache[key] = component
+        return cache[key]
+    
+    def apply_enterprise_styling(self):
+        """Apply clean enterprise styling"""
+        st.markdown(_ENTERPRISE_CSS, unsafe_allow_html=True)
     
     def render_header(self):
         """Render application header with status"""
-        name_service_status = self.validation_service.is_name_validation_available() if self.validation_service else False
-        address_service_status = self.validation_service.is_address_validation_available() if self.validation_service else False
+        if self.validation_service:
+            name_service_status, address_service_status = _service_status(id(self.validation_service))
+        else:
+            name_service_status = address_service_status = False
         
-        st.markdown('''
-        <div class="enterprise-header">
-            <div class="main-title">Enterprise Validator</div>
-            <div class="subtitle">Professional Name & Address Validation Platform with API Testing</div>
-        </div>
-        ''', unsafe_allow_html=True)
+        st.markdown(_HEADER_HTML, unsafe_allow_html=True)
         
         # Status indicators
         col1, col2, col3 = st.columns([1, 1, 1])
         
         with col2:
-            status_html = ""
-            if name_service_status:
-                status_html += '<span class="status-indicator status-success">✓ Name Validation Ready</span>'
-            else:
-                status_html += '<span class="status-indicator status-warning">⚠ Name Service Unavailable</span>'
-            
-            if address_service_status:
-                status_html += '<span class="status-indicator status-success">✓ Address Validation Ready</span>'
-            else:
-                status_html += '<span class="status-indicator status-warning">⚠ USPS API Not Configured</span>'
-            
-            st.markdown(f'<div style="text-align: center;">{status_html}</div>', unsafe_allow_html=True)
+            st.markdown(_STATUS_HTML[(name_service_status, address_service_status)], unsafe_allow_html=True)
     
     def render_name_validation_tab(self):
         """Render name validation functionality using the component"""
-        if self.name_validator_tab and COMPONENTS_AVAILABLE:
+        name_validator_tab = self._get_tab('name')
+        if name_validator_tab:
             # Use the component which now includes API testing
-            self.name_validator_tab.render()
+            name_validator_tab.render()
         else:
             # Fallback implementation if components not available
             st.error("❌ Name Validation component not available")
@@ -245,65 +339,65 @@ class EnterpriseValidatorApp:
             
             # Show basic debug info
             if self.validation_service:
+                name_ok, _ = _service_status(id(self.validation_service))
                 st.write("**Service Status:**")
-                st.write(f"- Name validation available: {self.validation_service.is_name_validation_available()}")
-                st.write(f"- Components available: {COMPONENTS_AVAILABLE}")
+                st.write(f"- Name validation available: {name_ok}")
+                st.write(f"- Services available: {SERVICES_AVAILABLE}")
     
     def render_address_validation_tab(self):
         """Render address validation functionality using the component"""
-        if self.address_validator_tab and COMPONENTS_AVAILABLE:
-            self.address_validator_tab.render()
+        address_validator_tab = self._get_tab('address')
+        if address_validator_tab:
+            address_validator_tab.render()
         else:
             # Fallback implementation
             st.error("❌ Address Validation component not available")
             st.info("Please ensure all components are properly installed and configured")
     
+    @st.fragment
     def render_monitoring_tab(self):
-        """Render monitoring functionality using the component"""
-        if self.monitoring_tab and COMPONENTS_AVAILABLE:
-            self.monitoring_tab.render()
+        """Render monitoring functionality using the component.
+
+        A fragment, so interacting with monitoring widgets (filters, log
+        views) reruns just this tab rather than the full script.
+        """
+        monitoring_tab = self._get_tab('monitoring')
+        if monitoring_tab:
+            monitoring_tab.render()
         else:
             # Fallback implementation
             st.markdown("## 📊 System Monitoring")
             
-            # Simple system status
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                name_status = "✅ Available" if (self.validation_service and 
-                                                self.validation_service.is_name_validation_available()) else "❌ Unavailable"
-                st.metric("Name Service", name_status)
-            
-            with col2:
-                addr_status = "✅ Available" if (self.validation_service and 
-                                               self.validation_service.is_address_validation_available()) else "❌ Unavailable"
-                st.metric("Address Service", addr_status)
+            # Simple system status - reuse the cached availability poll
+            # instead of probing the service again
+            if self.validation_service:
+                name_ok, addr_ok = _service_status(id(self.validation_service))
+            else:
+                name_ok = addr_ok = False
             
-            with col3:
-                uptime = datetime.now() - st.session_state.get('app_start_time', datetime.now())
-                st.metric("Uptime", f"{int(uptime.total_seconds() / 60)} min")
+            uptime_minutes = int((time.monotonic() - st.session_state.get('app_start_mono', time.monotonic())) / 60)
+            loaded_tabs = [k for k, v in st.session_state.get('_tab_components', {}).items() if v]
             
-            # Component status
-            st.markdown("### 🔧 Component Status")
-            st.write(f"- Components Available: {'✅' if COMPONENTS_AVAILABLE else '❌'}")
-            st.write(f"- Validation Service: {'✅' if self.validation_service else '❌'}")
-            st.write(f"- Name Validator Tab: {'✅' if self.name_validator_tab else '❌'}")
-            st.write(f"- Address Validator Tab: {'✅' if self.address_validator_tab else '❌'}")
-            st.write(f"- Monitoring Tab: {'✅' if self.monitoring_tab else '❌'}")
+            # One dataframe instead of a column of metrics and writes - a
+            # single element for Streamlit to diff and ship to the browser
+            st.dataframe(
+                [
+                    {'Component': 'Name Service', 'Status': '✅ Available' if name_ok else '❌ Unavailable'},
+                    {'Component': 'Address Service', 'Status': '✅ Available' if addr_ok else '❌ Unavailable'},
+                    {'Component': 'Uptime', 'Status': f"{uptime_minutes} min"},
+                    {'Component': 'Services Available', 'Status': '✅' if SERVICES_AVAILABLE else '❌'},
+                    {'Component': 'Validation Service', 'Status': '✅' if self.validation_service else '❌'},
+                    {'Component': 'Loaded Tabs', 'Status': ', '.join(loaded_tabs) if loaded_tabs else 'none'},
+                ],
+                hide_index=True,
+                use_container_width=True
+            )
     
     def run(self):
         """Main application entry point"""
-        # Initialize session state
-        if 'app_start_time' not in st.session_state:
-            st.session_state.app_start_time = datetime.now()
-        
-        # Configure page
-        st.set_page_config(
-            page_title="Enterprise Name & Address Validator",
-            page_icon="🔍",
-            layout="wide",
-            initial_sidebar_state="collapsed"
-        )
+        # Initialize session state. time.monotonic is immune to wall-clock
+        # jumps (NTP sync, DST) and cheaper than building datetime objects
+        st.session_state.setdefault('app_start_mono', time.monotonic())
         
         # Apply styling
         self.apply_enterprise_styling()
@@ -311,30 +405,37 @@ class EnterpriseValidatorApp:
         # Render header
         self.render_header()
         
-        # Debug info (can be removed in production)
-        if st.checkbox("🔧 Show Debug Info", value=False):
-            st.write("**Debug Information:**")
-            st.write(f"- Components Available: {COMPONENTS_AVAILABLE}")
-            st.write(f"- Validation Service: {self.validation_service is not None}")
-            st.write(f"- Name Validator Tab: {self.name_validator_tab is not None}")
-            st.write(f"- Address Validator Tab: {self.address_validator_tab is not None}")
-            st.write(f"- Monitoring Tab: {self.monitoring_tab is not None}")
+        # Debug info - only offered when VALIDATOR_DEBUG=1 is set, so
+        # production reruns skip the checkbox widget entirely
+        if os.environ.get("VALIDATOR_DEBUG") == "1" and st.checkbox("🔧 Show Debug Info", value=False):
+            loaded_tabs = [k for k, v in st.session_state.get('_tab_components', {}).items() if v]
+            st.json({
+                'services_available': SERVICES_AVAILABLE,
+                'validation_service': self.validation_service is not None,
+                'loaded_tabs': loaded_tabs
+            })
         
-        # Main tabs
-        name_tab, address_tab, monitoring_tab = st.tabs([
-            "👤 Name Validation", 
-            "🏠 Address Validation", 
-            "📊 Monitoring"
-        ])
+        # Main navigation - a radio-backed dispatch rather than st.tabs.
+        # Streamlit executes every `with tab:` block on each rerun, so all
+        # three tabs paid their full render cost while only one was visible;
+        # with the dispatch only the selected view runs
+        active_tab = st.radio(
+            "View",
+            ["👤 Name Validation", "🏠 Address Validation", "📊 Monitoring"],
+            horizontal=True,
+            label_visibility="collapsed",
+            key="active_tab"
+        )
         
-        with name_tab:
+        if active_tab == "👤 Name Validation":
             self.render_name_validation_tab()
-        
-        with address_tab:
+        elif active_tab == "🏠 Address Validation":
             self.render_address_validation_tab()
-        
-        with monitoring_tab:
+        else:
             self.render_monitoring_tab()
+        
+        # One console write for everything logged during this rerun
+        self.logger.flush()
 
 
 def main():
@@ -348,7 +449,7 @@ def main():
         
         # Show debug info
         st.write("**Debug Information:**")
-        st.write(f"- Components Available: {COMPONENTS_AVAILABLE}")
+        st.write(f"- Services Available: {SERVICES_AVAILABLE}")
         st.code(str(e))
 
 
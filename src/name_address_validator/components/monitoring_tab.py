@@ -4,9 +4,137 @@ Monitoring Tab - System monitoring, performance metrics, and debug logs
 """
 
 import streamlit as st
+import sys
 import pandas as pd
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+from ..utils.config import ADDRESS_RESULT_HISTORY
+
+# Level -> indicator used when formatting log lines; built once at import
+# instead of as a dict literal inside the per-log loop
+LEVEL_EMOJI = {
+    'ERROR': '🔴',
+    'WARNING': '🟡',
+    'INFO': '🔵',
+    'DEBUG': '⚪'
+}
+
+# Fixed stats schemas. Seeding session state with these once lets the
+# renderers index keys directly instead of paying a .get with a boxed
+# default on every access
+DEFAULT_NAME_STATS = {
+    'total_processed': 0,
+    'successful_validations': 0,
+    'failed_validations': 0,
+    'files_processed': 0
+}
+
+DEFAULT_ADDRESS_STATS = {
+    'total_processed': 0,
+    'successful_validations': 0,
+    'failed_validations': 0,
+    'files_processed': 0,
+    'addresses_qualified': 0
+}
+
+# Time-range label -> minutes for the debug-log filter; allocated once at
+# import rather than per render
+MINUTES_MAP = {
+    "Last 5 min": 5,
+    "Last 15 min": 15,
+    "Last Hour": 60,
+    "Last 4 Hours": 240
+}
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _detect_usps_configured(log_seq: int, _logs) -> bool:
+    """Scan the log buffer for USPS configuration evidence, cached.
+
+    The system-status tab re-ran this substring scan over the whole
+    buffer on every render; keyed on the logger's monotonic sequence it
+    runs once per new batch of logs. The sequence, not the buffer
+    length, is the key: the deque's length pins at maxlen once full.
+    """
+    for log in _logs:
+        message = log.get('message', '')
+        if 'USPS' in message and 'configured' in message:
+            return True
+    return False
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _recent_activity(log_seq: int, _logger) -> Dict[str, List]:
+    """Timeline columns for the overview, cached on the log sequence.
+
+    Flipping between monitoring tabs re-rendered the overview from
+    scratch, including a full-buffer scan in get_recent_logs; keyed on
+    the log sequence, a tab switch with no new logs reuses the
+    assembled columns untouched.
+    """
+    recent_logs = _logger.get_recent_logs(minutes=60)
+    
+    times, categories, messages, levels = [], [], [], []
+    for log in recent_logs[-20:]:  # Last 20 activities
+        message = log.get('message', '')
+        times.append(log['timestamp'].strftime('%H:%M:%S'))
+        categories.append(log.get('category', 'GENERAL'))
+        # short messages pass through untouched instead of paying a
+        # slice plus concat with an empty suffix
+        messages.append(message if len(message) <= 100 else message[:100] + '...')
+        levels.append(log.get('level', 'INFO'))
+    
+    return {'Time': times, 'Category': categories, 'Message': messages, 'Level': levels}
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _logs_frame(log_seq: int, _logs) -> pd.DataFrame:
+    """Columnar view of the log buffer for vectorized filtering.
+
+    Rebuilt only when new logs arrive. Filtering this frame
+    with boolean masks runs in C, where the previous chain of list
+    comprehensions walked the buffer once per active filter in the
+    interpreter.
+    """
+    frame = pd.DataFrame({
+        'timestamp': [log.get('timestamp') for log in _logs],
+        'level': [log.get('level', 'INFO') for log in _logs],
+        'category': [log.get('category', 'GENERAL') for log in _logs],
+        'message': [log.get('message', '') for log in _logs]
+    })
+    # Pre-format the display timestamp once with the vectorized dt
+    # accessor - per-row strftime was the slowest part of rendering the
+    # log slice, and cached here it is never repeated for old rows
+    frame['ts_str'] = pd.to_datetime(frame['timestamp']).dt.strftime('%H:%M:%S.%f').str[:-3]
+    return frame
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _export_logs(_logger, format_: str, log_seq: int) -> str:
+    """Serialized log export, cached on format and log sequence.
+
+    Download buttons need their payload up front, so without the cache
+    the full JSON/CSV dump ran on every logs-tab rerun.
+    """
+    return _logger.export_logs(format_)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _log_filter_options(log_seq: int, _logs) -> Tuple[List[str], List[str]]:
+    """Distinct levels and categories for the filter dropdowns.
+
+    Scanning the whole log buffer on every rerun just to fill two
+    selectboxes is O(N) per widget interaction; keyed on the log
+    sequence, unchanged logs skip the scan entirely.
+    """
+    levels = set()
+    categories = set()
+    for log in _logs:
+        levels.add(log.get('level', 'INFO'))
+        categories.add(log.get('category', 'GENERAL'))
+    return sorted(levels), sorted(categories)
 
 
 class MonitoringTab:
@@ -24,7 +152,9 @@ class MonitoringTab:
         st.markdown('<div class="validation-card">', unsafe_allow_html=True)
         st.markdown('<div class="section-title">System Monitoring & Performance</div>', unsafe_allow_html=True)
         
-        # Sub-tabs for different monitoring views
+        # Sub-tabs for different monitoring views. Each renderer is a
+        # fragment, so changing a widget in one tab (log filters, buttons)
+        # reruns only that tab instead of all four
         overview_tab, performance_tab, logs_tab, system_tab = st.tabs([
             "📊 Overview", "⚡ Performance", "🔍 Debug Logs", "🖥️ System Status"
         ])
@@ -43,44 +173,43 @@ class MonitoringTab:
         
         st.markdown('</div>', unsafe_allow_html=True)
     
+    @st.fragment
     def _render_overview(self):
         """Render system overview"""
         st.markdown("### 📈 System Overview")
         
-        # Calculate session uptime
-        uptime = datetime.now() - st.session_state.monitoring_session_start
-        uptime_str = str(uptime).split('.')[0]  # Remove microseconds
-        
-        # Get stats from session state
-        name_stats = st.session_state.get('name_processing_stats', {})
-        address_stats = st.session_state.get('address_processing_stats', {})
-        
-        # Overall metrics
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        with col1:
-            total_processed = name_stats.get('total_processed', 0) + address_stats.get('total_processed', 0)
-            st.metric("Total Records Processed", total_processed)
-        
-        with col2:
-            total_successful = (name_stats.get('successful_validations', 0) + 
-                               address_stats.get('successful_validations', 0))
-            st.metric("Successful Validations", total_successful)
-        
-        with col3:
-            total_files = name_stats.get('files_processed', 0) + address_stats.get('files_processed', 0)
-            st.metric("Files Processed", total_files)
-        
-        with col4:
-            st.metric("Session Uptime", uptime_str)
-        
-        with col5:
-            # Calculate overall success rate
-            if total_processed > 0:
-                success_rate = (total_successful / total_processed) * 100
-                st.metric("Success Rate", f"{success_rate:.1f}%")
-            else:
-                st.metric("Success Rate", "0%")
+        # Calculate session uptime with integer math - stringifying the
+        # timedelta and splitting off microseconds allocated two throwaway
+        # strings per render
+        total_seconds = int((datetime.now() - st.session_state.monitoring_session_start).total_seconds())
+        hours, remainder = divmod(total_seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        uptime_str = f"{hours}:{minutes:02d}:{seconds:02d}"
+        
+        # Get stats from session state, seeding the fixed schema once so
+        # the reads below can index directly
+        name_stats = st.session_state.setdefault('name_processing_stats', dict(DEFAULT_NAME_STATS))
+        address_stats = st.session_state.setdefault('address_processing_stats', dict(DEFAULT_ADDRESS_STATS))
+        
+        # Overall metrics - one dataframe instead of five metric widgets,
+        # so the rerun ships a single element rather than five deltas
+        total_processed = name_stats['total_processed'] + address_stats['total_processed']
+        total_successful = (name_stats['successful_validations'] + 
+                           address_stats['successful_validations'])
+        total_files = name_stats['files_processed'] + address_stats['files_processed']
+        success_rate = f"{(total_successful / total_processed) * 100:.1f}%" if total_processed > 0 else "0%"
+        
+        st.dataframe(
+            [{
+                'Total Records Processed': total_processed,
+                'Successful Validations': total_successful,
+                'Files Processed': total_files,
+                'Session Uptime': uptime_str,
+                'Success Rate': success_rate
+            }],
+            hide_index=True,
+            use_container_width=True
+        )
         
         # Service-specific metrics
         st.markdown("### 🔍 Service Breakdown")
@@ -89,9 +218,9 @@ class MonitoringTab:
         
         with col6:
             st.markdown("**Name Validation Service**")
-            name_processed = name_stats.get('total_processed', 0)
-            name_successful = name_stats.get('successful_validations', 0)
-            name_files = name_stats.get('files_processed', 0)
+            name_processed = name_stats['total_processed']
+            name_successful = name_stats['successful_validations']
+            name_files = name_stats['files_processed']
             
             if name_processed > 0:
                 name_success_rate = (name_successful / name_processed) * 100
@@ -104,9 +233,9 @@ class MonitoringTab:
         
         with col7:
             st.markdown("**Address Validation Service**")
-            addr_processed = address_stats.get('total_processed', 0)
-            addr_successful = address_stats.get('successful_validations', 0)
-            addr_files = address_stats.get('files_processed', 0)
+            addr_processed = address_stats['total_processed']
+            addr_successful = address_stats['successful_validations']
+            addr_files = address_stats['files_processed']
             addr_qualified = address_stats.get('addresses_qualified', 0)
             
             if addr_processed > 0:
@@ -119,28 +248,20 @@ class MonitoringTab:
             else:
                 st.write("- No address validations performed yet")
         
-        # Recent activity timeline
+        # Recent activity timeline, rebuilt only when logs have arrived
+        # since the last paint
         if hasattr(self.logger, 'get_recent_logs'):
-            recent_logs = self.logger.get_recent_logs(minutes=60)
-            if recent_logs:
+            timeline = _recent_activity(self.logger.log_seq, self.logger)
+            if timeline['Time']:
                 st.markdown("### 📅 Recent Activity (Last Hour)")
-                
-                # Create timeline data
-                timeline_data = []
-                for log in recent_logs[-20:]:  # Last 20 activities
-                    timeline_data.append({
-                        'Time': log['timestamp'].strftime('%H:%M:%S'),
-                        'Category': log.get('category', 'GENERAL'),
-                        'Message': log.get('message', '')[:100] + ('...' if len(log.get('message', '')) > 100 else ''),
-                        'Level': log.get('level', 'INFO')
-                    })
-                
-                if timeline_data:
-                    timeline_df = pd.DataFrame(timeline_data)
-                    st.dataframe(timeline_df, use_container_width=True)
+                st.dataframe(timeline, use_container_width=True)
             else:
                 st.info("No recent activity to display")
-    
+
+        # Fragment reruns skip run(), so buffered log output is flushed here
+        self.logger.flush()
+
+    @st.fragment
     def _render_performance_metrics(self):
         """Render performance metrics"""
         st.markdown("### ⚡ Performance Analytics")
@@ -153,56 +274,62 @@ class MonitoringTab:
                 st.markdown("#### 📊 Operation Performance")
                 
                 # Group metrics by operation type
-                operations = {}
+                operations = defaultdict(list)
                 for metric in metrics:
-                    op_name = metric.get('operation', 'unknown')
-                    if op_name not in operations:
-                        operations[op_name] = []
-                    operations[op_name].append(metric)
+                    operations[metric.get('operation', 'unknown')].append(metric)
                 
                 # Display performance for each operation
                 for operation, op_metrics in operations.items():
                     with st.expander(f"🔧 {operation.replace('_', ' ').title()}"):
                         
-                        # Calculate stats
-                        durations = [m['duration_ms'] for m in op_metrics if m.get('success', True)]
-                        success_count = sum(1 for m in op_metrics if m.get('success', True))
+                        # Calculate stats in one pass - the comprehensions
+                        # plus min/max/sum walked the list several times
                         total_count = len(op_metrics)
+                        success_count = 0
+                        total_duration = 0
+                        min_duration = None
+                        max_duration = None
                         
-                        if durations:
-                            avg_duration = sum(durations) / len(durations)
-                            min_duration = min(durations)
-                            max_duration = max(durations)
-                            
-                            col1, col2, col3, col4, col5 = st.columns(5)
-                            
-                            with col1:
-                                st.metric("Total Calls", total_count)
-                            
-                            with col2:
-                                st.metric("Successful", success_count)
-                            
-                            with col3:
-                                success_rate = (success_count / total_count) * 100
-                                st.metric("Success Rate", f"{success_rate:.1f}%")
-                            
-                            with col4:
-                                st.metric("Avg Duration", f"{avg_duration:.1f}ms")
+                        for m in op_metrics:
+                            if m.get('success', True):
+                                duration = m['duration_ms']
+                                success_count += 1
+                                total_duration += duration
+                                if min_duration is None or duration < min_duration:
+                                    min_duration = duration
+                                if max_duration is None or duration > max_duration:
+                                    max_duration = duration
+                        
+                        if success_count:
+                            avg_duration = total_duration / success_count
+                            success_rate = (success_count / total_count) * 100
                             
-                            with col5:
-                                st.metric("Duration Range", f"{min_duration}-{max_duration}ms")
+                            st.dataframe(
+                                [{
+                                    'Total Calls': total_count,
+                                    'Successful': success_count,
+                                    'Success Rate': f"{success_rate:.1f}%",
+                                    'Avg Duration': f"{avg_duration:.1f}ms",
+                                    'Duration Range': f"{min_duration}-{max_duration}ms"
+                                }],
+                                hide_index=True,
+                                use_container_width=True
+                            )
                             
-                            # Recent performance trend
+                            # Recent performance trend. Metrics are
+                            # appended in timestamp order, so the tail
+                            # slice already is the most recent ten - no
+                            # need to re-sort the whole list per rerun
                             if len(op_metrics) > 1:
-                                recent_metrics = sorted(op_metrics, key=lambda x: x['timestamp'])[-10:]
-                                trend_data = pd.DataFrame([
+                                recent_metrics = op_metrics[-10:]
+                                trend_data = [
                                     {
                                         'Time': m['timestamp'].strftime('%H:%M:%S'),
                                         'Duration (ms)': m['duration_ms'],
                                         'Success': '✅' if m.get('success', True) else '❌'
                                     }
                                     for m in recent_metrics
-                                ])
+                                ]
                                 
                                 st.write("**Recent Performance:**")
                                 st.dataframe(trend_data, use_container_width=True)
@@ -216,9 +343,11 @@ class MonitoringTab:
         # Resource usage (simplified)
         st.markdown("#### 🖥️ Resource Usage")
         
-        # Session state size estimation
-        session_size = len(str(st.session_state))
-        st.write(f"- Session State Size: ~{session_size:,} characters")
+        # Session state overview. len(str(...)) stringified every cached
+        # frame and log list on each rerun; shallow getsizeof over the
+        # top-level values is a comparable rough gauge at O(keys) cost
+        session_size = sum(sys.getsizeof(value) for value in st.session_state.values())
+        st.write(f"- Session State: {len(st.session_state)} keys, ~{session_size:,} bytes (shallow)")
         
         # Results storage
         name_results = len(st.session_state.get('name_validation_results', []))
@@ -229,31 +358,36 @@ class MonitoringTab:
             st.metric("Stored Name Results", name_results)
         with col2:
             st.metric("Stored Address Results", address_results)
-    
+
+        self.logger.flush()
+
+    @st.fragment
     def _render_debug_logs(self):
         """Render debug logs interface"""
         st.markdown("### 🔍 Debug Logs & Troubleshooting")
         
         if hasattr(self.logger, 'logs') and self.logger.logs:
             # Log filtering controls
+            levels, categories = _log_filter_options(self.logger.log_seq, self.logger.logs)
+            
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
                 level_filter = st.selectbox(
                     "Filter by Level",
-                    options=["ALL"] + list(set(log.get('level', 'INFO') for log in self.logger.logs))
+                    options=["ALL"] + levels
                 )
             
             with col2:
                 category_filter = st.selectbox(
                     "Filter by Category",
-                    options=["ALL"] + list(set(log.get('category', 'GENERAL') for log in self.logger.logs))
+                    options=["ALL"] + categories
                 )
             
             with col3:
                 time_filter = st.selectbox(
                     "Time Range",
-                    options=["All Time", "Last 5 min", "Last 15 min", "Last Hour", "Last 4 Hours"]
+                    options=["All Time"] + list(MINUTES_MAP)
                 )
             
             with col4:
@@ -264,75 +398,73 @@ class MonitoringTab:
                     value=100
                 )
             
-            # Apply filters
-            filtered_logs = self.logger.logs.copy()
-            
-            if level_filter != "ALL":
-                filtered_logs = [log for log in filtered_logs if log.get('level') == level_filter]
-            
-            if category_filter != "ALL":
-                filtered_logs = [log for log in filtered_logs if log.get('category') == category_filter]
+            logs_df = _logs_frame(self.logger.log_seq, self.logger.logs)
             
-            if time_filter != "All Time":
-                minutes_map = {
-                    "Last 5 min": 5,
-                    "Last 15 min": 15,
-                    "Last Hour": 60,
-                    "Last 4 Hours": 240
-                }
-                minutes = minutes_map[time_filter]
-                cutoff_time = datetime.now() - timedelta(minutes=minutes)
-                filtered_logs = [log for log in filtered_logs if log.get('timestamp', datetime.now()) > cutoff_time]
+            if level_filter == "ALL" and category_filter == "ALL" and time_filter == "All Time":
+                # Nothing to filter - the common default view goes straight
+                # to the tail slice without evaluating any mask
+                filtered_df = logs_df
+            else:
+                # Logs are append-only, so the timestamp column is already
+                # sorted: the time cutoff is a binary search to a start
+                # index instead of a comparison across the whole buffer
+                if time_filter != "All Time":
+                    cutoff_time = datetime.now() - timedelta(minutes=MINUTES_MAP[time_filter])
+                    logs_df = logs_df.iloc[logs_df['timestamp'].searchsorted(cutoff_time, side='right'):]
+                
+                # Remaining filters as boolean masks on the reduced view
+                mask = pd.Series(True, index=logs_df.index)
+                
+                if level_filter != "ALL":
+                    mask &= logs_df['level'] == level_filter
+                
+                if category_filter != "ALL":
+                    mask &= logs_df['category'] == category_filter
+                
+                filtered_df = logs_df[mask]
             
             # Display logs
-            if filtered_logs:
-                st.write(f"**Showing {min(len(filtered_logs), max_logs)} of {len(filtered_logs)} matching logs**")
+            if not filtered_df.empty:
+                st.write(f"**Showing {min(len(filtered_df), max_logs)} of {len(filtered_df)} matching logs**")
                 
-                # Format logs for display
-                log_entries = []
-                for log in filtered_logs[-max_logs:]:
-                    timestamp = log.get('timestamp', datetime.now()).strftime("%H:%M:%S.%f")[:-3]
-                    level = log.get('level', 'INFO')
-                    category = log.get('category', 'GENERAL')
-                    message = log.get('message', '')
-                    
-                    # Color code by level
-                    level_emoji = {
-                        'ERROR': '🔴',
-                        'WARNING': '🟡',
-                        'INFO': '🔵',
-                        'DEBUG': '⚪'
-                    }.get(level, '⚪')
-                    
-                    log_entries.append(f"[{timestamp}] {level_emoji} {level} {category}: {message}")
+                # Format logs column-wise: whole-column string concat and
+                # a map for the emoji replace five per-row lookups with a
+                # handful of vectorized passes over the display slice
+                display_df = filtered_df.tail(max_logs)
+                emoji = display_df['level'].map(LEVEL_EMOJI).fillna('⚪')
+                log_lines = (
+                    '[' + display_df['ts_str'] + '] ' + emoji + ' ' + display_df['level']
+                    + ' ' + display_df['category'] + ': ' + display_df['message']
+                )
                 
                 # Display in code block for better formatting
-                st.code("\n".join(log_entries), language="text")
+                st.code("\n".join(log_lines), language="text")
                 
-                # Export options
+                # Export options - direct download buttons fed from the
+                # cached serialization, instead of a button that reruns the
+                # full dump and then reveals a second download button
                 col5, col6, col7 = st.columns(3)
+                export_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 
                 with col5:
-                    if st.button("📥 Export Logs (JSON)", use_container_width=True):
-                        if hasattr(self.logger, 'export_logs'):
-                            json_data = self.logger.export_logs("json")
-                            st.download_button(
-                                "Download JSON",
-                                data=json_data,
-                                file_name=f"debug_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                                mime="application/json"
-                            )
+                    if hasattr(self.logger, 'export_logs'):
+                        st.download_button(
+                            "📥 Export Logs (JSON)",
+                            data=_export_logs(self.logger, "json", self.logger.log_seq),
+                            file_name=f"debug_logs_{export_timestamp}.json",
+                            mime="application/json",
+                            use_container_width=True
+                        )
                 
                 with col6:
-                    if st.button("📥 Export Logs (CSV)", use_container_width=True):
-                        if hasattr(self.logger, 'export_logs'):
-                            csv_data = self.logger.export_logs("csv")
-                            st.download_button(
-                                "Download CSV",
-                                data=csv_data,
-                                file_name=f"debug_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                                mime="text/csv"
-                            )
+                    if hasattr(self.logger, 'export_logs'):
+                        st.download_button(
+                            "📥 Export Logs (CSV)",
+                            data=_export_logs(self.logger, "csv", self.logger.log_seq),
+                            file_name=f"debug_logs_{export_timestamp}.csv",
+                            mime="text/csv",
+                            use_container_width=True
+                        )
                 
                 with col7:
                     if st.button("🗑️ Clear Logs", use_container_width=True):
@@ -344,7 +476,10 @@ class MonitoringTab:
                 st.info("No logs match the current filters")
         else:
             st.info("No debug logs available")
-    
+
+        self.logger.flush()
+
+    @st.fragment
     def _render_system_status(self):
         """Render system status information"""
         st.markdown("### 🖥️ System Status & Health Check")
@@ -372,13 +507,11 @@ class MonitoringTab:
             st.markdown("**Address Validation Service**")
             address_stats = st.session_state.get('address_processing_stats', {})
             
-            # Check if we have USPS configuration info in logs
+            # Check if we have USPS configuration info in logs (cached
+            # per log-count so the scan doesn't repeat on every render)
             usps_configured = False
             if hasattr(self.logger, 'logs'):
-                for log in self.logger.logs:
-                    if 'USPS' in log.get('message', '') and 'configured' in log.get('message', ''):
-                        usps_configured = True
-                        break
+                usps_configured = _detect_usps_configured(self.logger.log_seq, self.logger.logs)
             
             if usps_configured:
                 st.success("✅ USPS API Connected")
@@ -436,25 +569,16 @@ class MonitoringTab:
         with col3:
             if st.button("🗑️ Clear Name Results", type="secondary", use_container_width=True):
                 st.session_state.name_validation_results = []
-                st.session_state.name_processing_stats = {
-                    'total_processed': 0,
-                    'successful_validations': 0,
-                    'failed_validations': 0,
-                    'files_processed': 0
-                }
+                st.session_state.name_processing_stats = dict(DEFAULT_NAME_STATS)
                 st.success("Name validation results cleared")
                 st.rerun()
         
         with col4:
             if st.button("🗑️ Clear Address Results", type="secondary", use_container_width=True):
-                st.session_state.address_validation_results = []
-                st.session_state.address_processing_stats = {
-                    'total_processed': 0,
-                    'successful_validations': 0,
-                    'failed_validations': 0,
-                    'files_processed': 0,
-                    'addresses_qualified': 0
-                }
+                # Keep the bounded deque the address tab created - a plain
+                # list here would grow without limit after one clear
+                st.session_state.address_validation_results = deque(maxlen=ADDRESS_RESULT_HISTORY)
+                st.session_state.address_processing_stats = dict(DEFAULT_ADDRESS_STATS)
                 st.success("Address validation results cleared")
                 st.rerun()
         
@@ -465,4 +589,6 @@ class MonitoringTab:
                     del st.session_state[key]
             
             st.success("Session reset completed")
-            st.rerun()
\ No newline at end of file
+            st.rerun()
+
+        self.logger.flush()
\ No newline at end of file
@@ -4,11 +4,12 @@ Name Validator Tab - Clean Implementation
 Handles single, multi-file, and API name validation
 """
 
+import io
 import streamlit as st
 import pandas as pd
 import time
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple
 
 # Import the API tab component
 try:
@@ -17,6 +18,30 @@ try:
 except ImportError:
     API_TAB_AVAILABLE = False
 
+try:
+    from ..utils.name_format_standardizer import COLUMN_ALIASES
+    NAME_COLUMN_ALIASES = frozenset(
+        alias for alias, std_col in COLUMN_ALIASES.items() if std_col == 'name'
+    )
+except ImportError:
+    NAME_COLUMN_ALIASES = frozenset({'name', 'full_name', 'fullname'})
+
+from ..utils.csv_io import parse_csv
+
+
+def _has_name_column(file_bytes: bytes) -> bool:
+    """Header-only sniff so files with no name column skip the full parse.
+
+    Uses the same alias cleaning as the standardizer's column detection, so
+    a file rejected here would have failed standardization anyway.
+    """
+    try:
+        header = pd.read_csv(io.BytesIO(file_bytes), nrows=0).columns
+    except Exception:
+        return True  # let the full pipeline surface the parse error
+    cleaned = {str(col).lower().strip().replace(' ', '') for col in header}
+    return not NAME_COLUMN_ALIASES.isdisjoint(cleaned)
+
 
 class NameValidatorTab:
     """Name validation tab component with API testing capabilities"""
@@ -256,7 +281,7 @@ class NameValidatorTab:
             with st.expander("📋 File Information"):
                 for i, file in enumerate(uploaded_files, 1):
                     try:
-                        df = pd.read_csv(file)
+                        df = parse_csv(file.getvalue(), file.name, dtype_str=True)
                         st.write(f"**{i}. {file.name}** - {len(df)} rows, {len(df.columns)} columns")
                         st.write(f"   Columns: {list(df.columns)}")
                     except Exception as e:
@@ -302,6 +327,11 @@ class NameValidatorTab:
                     self._process_multi_file_names(
                         uploaded_files, max_records, include_suggestions, detailed_output
                     )
+            
+            # Render results from session state so they survive the rerun a
+            # download click triggers, without re-running the pipeline
+            if 'name_multi_results' in st.session_state:
+                self._display_multi_file_results(st.session_state['name_multi_results'])
     
     def _process_name_preview(self, uploaded_files, max_records: int):
         """Generate preview of name processing"""
@@ -309,11 +339,17 @@ class NameValidatorTab:
             # Convert uploaded files to format expected by service
             file_data_list = []
             for uploaded_file in uploaded_files:
-                df = pd.read_csv(uploaded_file)
-                if max_records:
-                    df = df.head(max_records)
+                file_bytes = uploaded_file.getvalue()
+                if not _has_name_column(file_bytes):
+                    st.warning(f"⚠️ Skipping {uploaded_file.name}: no name column found")
+                    continue
+                df = parse_csv(file_bytes, uploaded_file.name, nrows=max_records, dtype_str=True)
                 file_data_list.append((df, uploaded_file.name))
             
+            if not file_data_list:
+                st.error("No uploaded file has a recognizable name column")
+                return
+            
             with st.spinner("🔄 Generating name processing preview..."):
                 # Use the name standardization service
                 standardization_result = self.validation_service.standardize_and_parse_names_from_csv(file_data_list)
@@ -394,11 +430,17 @@ class NameValidatorTab:
             # Convert uploaded files
             file_data_list = []
             for uploaded_file in uploaded_files:
-                df = pd.read_csv(uploaded_file)
-                if max_records:
-                    df = df.head(max_records)
+                file_bytes = uploaded_file.getvalue()
+                if not _has_name_column(file_bytes):
+                    st.warning(f"⚠️ Skipping {uploaded_file.name}: no name column found")
+                    continue
+                df = parse_csv(file_bytes, uploaded_file.name, nrows=max_records, dtype_str=True)
                 file_data_list.append((df, uploaded_file.name))
             
+            if not file_data_list:
+                st.error("No uploaded file has a recognizable name column")
+                return
+            
             with st.spinner("🔄 Processing names through complete validation pipeline..."):
                 # Use complete name validation pipeline
                 pipeline_result = self.validation_service.process_complete_name_validation_pipeline(
@@ -408,7 +450,15 @@ class NameValidatorTab:
                 )
                 
                 if pipeline_result['success']:
-                    self._display_multi_file_results(pipeline_result)
+                    # Build the results frame and encode the download payload
+                    # once, at processing time - rendering on later reruns
+                    # then reuses them instead of re-encoding
+                    records = pipeline_result['validation']['records']
+                    results_df = pd.DataFrame(records)
+                    st.session_state['name_multi_results'] = pipeline_result
+                    st.session_state['name_multi_results_df'] = results_df
+                    st.session_state['name_multi_results_csv'] = results_df.to_csv(index=False)
+                    st.session_state['name_multi_results_ts'] = datetime.now().strftime('%Y%m%d_%H%M%S')
                     
                     # Update stats
                     summary = pipeline_result['summary']
@@ -424,8 +474,14 @@ class NameValidatorTab:
             st.error(f"Multi-file processing error: {str(e)}")
             self.logger.log(f"Multi-file name processing error: {e}", "NAME_PROCESSING", level="ERROR")
     
+    @st.fragment
     def _display_multi_file_results(self, pipeline_result: Dict):
-        """Display multi-file processing results"""
+        """Display multi-file processing results.
+
+        Runs as a fragment so clicking a download button reruns only this
+        block instead of the whole script (which would reparse uploads and
+        re-render every tab).
+        """
         st.markdown("### 🎉 Multi-File Processing Results")
         
         summary = pipeline_result['summary']
@@ -453,16 +509,23 @@ class NameValidatorTab:
         # Results table
         if validation_result['records']:
             st.markdown("### 📊 Detailed Results")
-            results_df = pd.DataFrame(validation_result['records'])
+            results_df = st.session_state.get('name_multi_results_df')
+            if results_df is None:
+                results_df = pd.DataFrame(validation_result['records'])
             st.dataframe(results_df, use_container_width=True)
             
-            # Download options
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # Download options - the timestamp is fixed at processing time so
+            # reruns keep the widget identity (and filename) stable
+            timestamp = st.session_state.get('name_multi_results_ts')
+            if timestamp is None:
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
             col1, col2 = st.columns(2)
             
             with col1:
-                csv_data = results_df.to_csv(index=False)
+                csv_data = st.session_state.get('name_multi_results_csv')
+                if csv_data is None:
+                    csv_data = results_df.to_csv(index=False)
                 st.download_button(
                     "📥 Download Results (CSV)",
                     data=csv_data,
@@ -472,21 +535,17 @@ class NameValidatorTab:
                 )
             
             with col2:
-                # Summary statistics
-                stats_data = {
-                    'Metric': ['Files Processed', 'Names Validated', 'Successful Validations', 
-                              'Failed Validations', 'Success Rate', 'Processing Time'],
-                    'Value': [
-                        summary['files_processed'],
-                        summary['validated_names'],
-                        summary['successful_validations'],
-                        summary['failed_validations'],
-                        f"{summary['validation_success_rate']:.1%}",
-                        f"{pipeline_result.get('pipeline_duration_ms', 0) / 1000:.1f}s"
-                    ]
-                }
-                stats_df = pd.DataFrame(stats_data)
-                stats_csv = stats_df.to_csv(index=False)
+                # Summary statistics - six fixed rows, so emit the CSV
+                # directly instead of building a DataFrame just to serialize it
+                stats_csv = '\n'.join([
+                    'Metric,Value',
+                    f"Files Processed,{summary['files_processed']}",
+                    f"Names Validated,{summary['validated_names']}",
+                    f"Successful Validations,{summary['successful_validations']}",
+                    f"Failed Validations,{summary['failed_validations']}",
+                    f"Success Rate,{summary['validation_success_rate']:.1%}",
+                    f"Processing Time,{pipeline_result.get('pipeline_duration_ms', 0) / 1000:.1f}s"
+                ])
                 
                 st.download_button(
                     "📊 Download Summary",
@@ -2,6 +2,11 @@ import os
 import streamlit as st
 from typing import Tuple, Optional
 
+# How many single-address results to keep in session history. Shared by
+# the address tab (which creates the bounded deque) and the monitoring
+# tab (which resets it), so the bound can't drift between the two
+ADDRESS_RESULT_HISTORY = 50
+
 
 def load_usps_credentials() -> Tuple[Optional[str], Optional[str]]:
     """Load USPS credentials from secrets or environment with debug logging"""
@@ -0,0 +1,51 @@
+# src/name_address_validator/utils/csv_io.py
+"""
+Shared cached CSV parsing for uploaded files
+
+Both validator tabs parse uploads the same way; keeping the single
+implementation here means the engine fallback and cache policy cannot
+drift between components.
+"""
+
+import io
+from typing import Optional
+
+import pandas as pd
+import streamlit as st
+
+# pandas' pyarrow engine parses CSV on multiple threads; fall back to the
+# single-threaded C engine when pyarrow is not installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def parse_csv(file_bytes: bytes, file_name: str, nrows: Optional[int] = None,
+              dtype_str: bool = False) -> pd.DataFrame:
+    """Parse uploaded CSV bytes once per unique content.
+
+    Streamlit reruns the whole script on every widget interaction, so
+    without the cache the same files were re-parsed on each click. Keyed
+    on the raw bytes (plus name for cache readability), repeat reruns get
+    the parsed frame back instantly.
+
+    nrows caps the parse itself, so capped reads never materialize rows
+    that would be thrown away; the pyarrow engine does not support nrows,
+    so that path uses the C engine. dtype_str skips per-column dtype
+    inference for callers that str()-coerce every value anyway.
+    """
+    kwargs = {'dtype': str, 'keep_default_na': False} if dtype_str else {}
+
+    if nrows is not None:
+        return pd.read_csv(io.BytesIO(file_bytes), nrows=nrows, **kwargs)
+
+    try:
+        return pd.read_csv(io.BytesIO(file_bytes), engine=CSV_ENGINE, **kwargs)
+    except Exception:
+        if CSV_ENGINE == "c":
+            raise
+        # pyarrow is stricter about malformed rows than the C parser
+        return pd.read_csv(io.BytesIO(file_bytes), **kwargs)
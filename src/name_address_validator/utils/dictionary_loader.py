@@ -14,6 +14,11 @@ try:
 except ImportError:
     FUZZYWUZZY_AVAILABLE = False
 
+# Compiled once; lowercase letters, hyphens and apostrophes only
+VALID_NAME_RE = re.compile(r"^[a-z\-\']+$")
+
+ORG_INDICATORS = ('llc', 'inc', 'corp', 'company', 'trust', 'bank', 'hospital', 'pediatrics')
+
 
 class NameDictionaryLoader:
     """Simple dictionary loader"""
@@ -50,9 +55,11 @@ class NameDictionaryLoader:
                     df = pd.read_csv(csv_file)
                     print(f"[DICT] Loading {csv_file.name}: {len(df)} rows")
                     
-                    # Get first column as names
+                    # Get first column as names - filter with vectorized
+                    # string ops instead of a per-name Python loop
                     names = df.iloc[:, 0].dropna().astype(str).str.strip().str.lower()
-                    valid_names = {name for name in names if self._is_valid_name(name)}
+                    mask = (names.str.len() > 1) & (names != 'nan') & names.str.match(VALID_NAME_RE)
+                    valid_names = set(names[mask])
                     
                     # Add to appropriate set based on filename
                     filename = csv_file.name.lower()
@@ -78,8 +85,8 @@ class NameDictionaryLoader:
     
     def _is_valid_name(self, name: str) -> bool:
         """Quick name validation"""
-        return (name and len(name) > 1 and name != 'nan' and 
-                re.match(r'^[a-z\-\']+$', name))
+        return bool(name and len(name) > 1 and name != 'nan' and
+                    VALID_NAME_RE.match(name))
     
     def is_valid_first_name(self, name: str) -> bool:
         """Check first name"""
@@ -119,5 +126,4 @@ class NameDictionaryLoader:
             return False
         
         name_lower = full_name.lower()
-        org_indicators = ['llc', 'inc', 'corp', 'company', 'trust', 'bank', 'hospital', 'pediatrics']
-        return any(indicator in name_lower for indicator in org_indicators)
\ No newline at end of file
+        return any(indicator in name_lower for indicator in ORG_INDICATORS)
\ No newline at end of file
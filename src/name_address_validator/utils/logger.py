@@ -1,17 +1,34 @@
 import streamlit as st
+import sys
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Deque, Dict, List, Optional
 import json
 
 
 class AppLogger:
     """Enterprise application logger with performance tracking"""
     
-    def __init__(self, max_logs: int = 1000):
-        self.logs: List[Dict] = []
-        self.performance_metrics: List[Dict] = []
+    def __init__(self, max_logs: int = 1000, buffered: bool = False):
         self.max_logs = max_logs
+        # Buffered mode queues console lines until a host calls flush();
+        # only hosts that actually flush (the Streamlit app at the end of
+        # each rerun) should enable it, otherwise lines would sit in the
+        # buffer and eventually be dropped on overflow
+        self.buffered = buffered
         self.max_metrics = 500
+        # Bounded ring buffers: appending past maxlen drops the oldest entry
+        # in O(1) instead of periodically rebuilding a trimmed list
+        self.logs: Deque[Dict] = deque(maxlen=max_logs)
+        self.performance_metrics: Deque[Dict] = deque(maxlen=self.max_metrics)
+        # Console lines queue up here and go out in one write per flush()
+        # instead of one syscall per log call
+        self._console_buf: Deque[str] = deque(maxlen=max_logs)
+        # Monotonic count of log() calls. Caches derived from the buffer key
+        # on this instead of len(self.logs): once the deque saturates its
+        # length pins at maxlen and a length-based key would never change
+        # again, freezing every cached view
+        self.log_seq = 0
         self.enabled = True
     
     def log(self, message: str, category: str = "GENERAL", level: str = "INFO", **kwargs):
@@ -28,14 +45,16 @@ class AppLogger:
         }
         
         self.logs.append(log_entry)
-        
-        # Maintain log size
-        if len(self.logs) > self.max_logs:
-            self.logs = self.logs[-self.max_logs:]
-        
-        # Console output for debugging
+        self.log_seq += 1
+
+        # Buffered hosts get one write per flush(); everyone else gets
+        # immediate console output
         timestamp_str = log_entry['timestamp'].strftime("%H:%M:%S")
-        print(f"[{timestamp_str}] {level.upper()} {category}: {message}")
+        line = f"[{timestamp_str}] {log_entry['level']} {log_entry['category']}: {message}"
+        if self.buffered:
+            self._console_buf.append(line)
+        else:
+            print(line)
     
     def info(self, message: str, category: str = "GENERAL", **kwargs):
         """Log info message"""
@@ -65,13 +84,23 @@ class AppLogger:
         
         self.performance_metrics.append(metric)
         
-        # Maintain metrics size
-        if len(self.performance_metrics) > self.max_metrics:
-            self.performance_metrics = self.performance_metrics[-self.max_metrics:]
-        
         self.log(f"Performance: {operation} completed in {duration_ms}ms ({'success' if success else 'failure'})", 
                 "PERFORMANCE", "DEBUG")
     
+    def flush(self):
+        """Write all buffered console output in a single call.
+
+        Buffered hosts (the app at the end of each rerun or fragment) get
+        one write per batch of log lines instead of one per log() call.
+        A no-op for unbuffered loggers.
+        """
+        if not self._console_buf:
+            return
+        
+        text = '\n'.join(self._console_buf)
+        self._console_buf.clear()
+        sys.stdout.write(text + '\n')
+    
     def get_logs_by_level(self, level: str) -> List[Dict]:
         """Get logs by level"""
         return [log for log in self.logs if log['level'] == level.upper()]
@@ -144,8 +173,9 @@ class AppLogger:
     
     def clear(self):
         """Clear all logs and metrics"""
-        self.logs = []
-        self.performance_metrics = []
+        self.flush()
+        self.logs.clear()
+        self.performance_metrics.clear()
         self.log("Logger cleared", "SYSTEM", "INFO")
     
     def disable(self):